@@ -0,0 +1,6 @@
+"""
+pytest configuration for the backend
+"""
+
+# Manual scripts that exercise a running API server, not unit tests
+collect_ignore = ["test_new_api.py", "test_simple_api.py"]
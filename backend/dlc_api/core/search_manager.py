@@ -44,36 +44,11 @@ class SearchManager:
             # Get active vendor IDs
             active_vendor_ids = self.scraper_registry.get_active_vendor_ids()
             
-            # Execute scrapers for each vendor
-            for vendor_id in active_vendor_ids:
-                try:
-                    # Get scraper instance (singleton)
-                    scraper = self.scraper_registry.get_scraper(vendor_id)
-                    
-                    # Add vendor started event
-                    search.add_vendor_started(vendor_id, scraper.vendor.name)
-                    
-                    # Execute scraper
-                    result = await scraper.search(search.query, search.max_results)
-                    
-                    if result.success:
-                        # Add products to search
-                        for product in result.products:
-                            search.add_product(product)
-                        
-                        # Add vendor completed event
-                        search.add_vendor_completed(
-                            vendor_id, 
-                            len(result.products), 
-                            result.duration
-                        )
-                    else:
-                        # Add vendor error event
-                        search.add_vendor_error(vendor_id, result.error_message or "Unknown error")
-                
-                except Exception as e:
-                    # Handle individual vendor errors
-                    search.add_vendor_error(vendor_id, str(e))
+            # Execute scrapers for all vendors concurrently
+            await asyncio.gather(*(
+                self._execute_vendor(search, vendor_id)
+                for vendor_id in active_vendor_ids
+            ))
             
             # Mark search as completed
             search.complete()
@@ -83,4 +58,34 @@ class SearchManager:
             search.fail(str(e))
         
         # Note: Search cleanup is handled separately to allow result retrieval
+    
+    async def _execute_vendor(self, search: Search, vendor_id: str):
+        """Execute a single vendor's scraper and record its events."""
+        try:
+            # Get scraper instance (singleton)
+            scraper = self.scraper_registry.get_scraper(vendor_id)
+            
+            # Add vendor started event
+            search.add_vendor_started(vendor_id, scraper.vendor.name)
+            
+            # Execute scraper
+            result = await scraper.search(search.query, search.max_results)
+            
+            if result.success:
+                # Add products to search
+                search.add_products(result.products)
+                
+                # Add vendor completed event
+                search.add_vendor_completed(
+                    vendor_id, 
+                    len(result.products), 
+                    result.duration
+                )
+            else:
+                # Add vendor error event
+                search.add_vendor_error(vendor_id, result.error_message or "Unknown error")
+        
+        except Exception as e:
+            # Handle individual vendor errors
+            search.add_vendor_error(vendor_id, str(e))
 
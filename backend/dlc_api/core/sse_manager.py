@@ -3,14 +3,17 @@ SSE Manager - Core business logic for Server-Sent Events
 """
 
 import asyncio
-import json
 from typing import Dict, List, AsyncGenerator
 from ..models import Search, SearchEvent
+from ..utils.json import dumps as json_dumps
 
 
 class SSEManager:
     """Manages Server-Sent Events for real-time search updates."""
     
+    # Seconds without events before a heartbeat is sent
+    HEARTBEAT_INTERVAL = 15.0
+    
     def __init__(self):
         self.subscribers: Dict[str, List[asyncio.Queue]] = {}
     
@@ -23,6 +26,9 @@ class SSEManager:
             self.subscribers[search_id] = []
         self.subscribers[search_id].append(queue)
         
+        # Pending queue read, kept across heartbeats instead of being cancelled
+        get_task = None
+        
         try:
             # Send initial connection event
             yield self._format_sse_event("connected", {
@@ -32,23 +38,44 @@ class SSEManager:
             
             # Listen for events
             while True:
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
-                    yield self._format_sse_event(event.event, event.data)
-                    
-                    # If it's a completion event, break the loop
-                    if event.event in ["completed", "error"]:
-                        break
-                        
-                except asyncio.TimeoutError:
+                if get_task is None:
+                    get_task = asyncio.ensure_future(queue.get())
+                
+                done, _ = await asyncio.wait({get_task}, timeout=self.HEARTBEAT_INTERVAL)
+                if not done:
                     # Send heartbeat to keep connection alive
                     yield self._format_sse_event("heartbeat", {
                         "timestamp": asyncio.get_event_loop().time()
                     })
+                    continue
+                
+                events = [get_task.result()]
+                get_task = None
+                
+                # Drain any burst of queued events so it is sent as one chunk
+                while not queue.empty():
+                    events.append(queue.get_nowait())
+                
+                chunk = []
+                finished = False
+                for event in events:
+                    chunk.append(self._format_sse_event(event.event, event.data))
+                    
+                    # If it's a completion event, stop after sending it
+                    if event.event in ["completed", "error"]:
+                        finished = True
+                        break
+                
+                yield "".join(chunk)
+                if finished:
+                    break
                     
         except asyncio.CancelledError:
             pass
         finally:
+            if get_task is not None:
+                get_task.cancel()
+            
             # Remove subscriber
             if search_id in self.subscribers:
                 if queue in self.subscribers[search_id]:
@@ -75,7 +102,7 @@ class SSEManager:
     
     def _format_sse_event(self, event_type: str, data: dict) -> str:
         """Format data as Server-Sent Event."""
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+        return f"event: {event_type}\ndata: {json_dumps(data)}\n\n"
     
     def get_subscriber_count(self, search_id: str) -> int:
         """Get number of subscribers for a search."""
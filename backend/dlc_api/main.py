@@ -3,7 +3,10 @@ DondeLoCompro.gt API - New OOP Architecture
 A simplified, scalable API for product price comparison in Guatemala
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
+import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -45,6 +48,21 @@ class DondeLoComproAPI:
         
         self._initialized = True
     
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Application lifespan management."""
+        # Startup: warm scraper connections in the background so a slow or
+        # unreachable vendor never delays the server from accepting requests
+        warm_up_task = asyncio.create_task(self.scraper_registry.warm_up())
+        yield
+        # Shutdown: stop an unfinished warm-up, then close pooled scraper connections
+        warm_up_task.cancel()
+        try:
+            await warm_up_task
+        except asyncio.CancelledError:
+            pass
+        await self.scraper_registry.aclose()
+    
     def _create_app(self) -> FastAPI:
         """Create and configure FastAPI application."""
         app = FastAPI(
@@ -52,7 +70,8 @@ class DondeLoComproAPI:
             description="Product price comparison API for Guatemala",
             version="2.0.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            lifespan=self._lifespan
         )
         
         # Add CORS middleware
@@ -80,10 +99,8 @@ api_instance = DondeLoComproAPI()
 app = api_instance.get_app()
 
 
-# For backwards compatibility and direct execution
-if __name__ == "__main__":
-    import uvicorn
-    
+def main():
+    """Main entry point."""
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
     
@@ -97,6 +114,11 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop="auto"  # uvloop when installed (uvicorn[standard]), else asyncio
     )
 
+
+# For backwards compatibility and direct execution
+if __name__ == "__main__":
+    main()
@@ -69,6 +69,22 @@ class Search:
             "product": product.model_dump()
         })
     
+    def add_products(self, products: List[Product]):
+        """Add a batch of products to search results."""
+        timestamp = datetime.now(timezone.utc)
+        self.products.extend(products)
+        self.events.extend(
+            SearchEvent(
+                event="product_found",
+                data={
+                    "vendor_id": product.vendor_id,
+                    "product": product.model_dump()
+                },
+                timestamp=timestamp
+            )
+            for product in products
+        )
+    
     def add_vendor_started(self, vendor_id: str, vendor_name: str):
         """Add vendor started event."""
         self.add_event("vendor_started", {
@@ -2,11 +2,14 @@
 Vendor model for store/vendor information
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Vendor(BaseModel):
     """Vendor/Store information."""
+    # Vendors are shared class-level constants, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique vendor identifier")
     name: str = Field(..., description="Display name of the vendor")
     base_url: str = Field(..., description="Base URL of the vendor website")
@@ -13,9 +13,6 @@ _registry = get_scraper_registry()
 # Available scrapers (for compatibility with existing code)
 SCRAPERS = _registry.get_scraper_classes()
 
-# Available vendors (for compatibility with existing code)  
-VENDORS = _registry.get_all_vendors()
-
 __all__ = [
     "BaseScraper",
     "CemacoScraper", 
@@ -27,7 +24,6 @@ __all__ = [
     "get_vendor",
     "get_all_vendors", 
     "get_active_vendors",
-    "SCRAPERS",
-    "VENDORS"
+    "SCRAPERS"
 ]
 
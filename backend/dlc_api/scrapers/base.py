@@ -34,6 +34,14 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def warm_up(self):
+        """Prepare the scraper for its first search (e.g. open connections)."""
+        pass
+    
+    async def aclose(self):
+        """Release any resources held by the scraper (e.g. HTTP sessions)."""
+        pass
+    
     def __repr__(self):
         return f"{self.__class__.__name__}(vendor_id='{self.vendor.id}')"
 
@@ -4,12 +4,34 @@ Cemaco Scraper - Functional implementation for VTEX-based e-commerce
 
 import asyncio
 import aiohttp
+import logging
 import time
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from ..models import Vendor, Product, ScrapingResult
+from ..utils.json import loads as json_loads
 from .base import BaseScraper
 
+logger = logging.getLogger(__name__)
+
+# Precompiled key/index paths into a VTEX product record
+_OFFER_PATH = ("items", 0, "sellers", 0, "commertialOffer")
+_IMAGE_URL_PATH = ("items", 0, "images", 0, "imageUrl")
+
+
+def _follow(record, path):
+    """Follow a key/index path through nested VTEX data, or return None."""
+    for step in path:
+        if isinstance(step, str):
+            if not isinstance(record, dict):
+                return None
+            record = record.get(step)
+        else:
+            if not isinstance(record, list) or len(record) <= step:
+                return None
+            record = record[step]
+    return record
+
 
 class CemacoScraper(BaseScraper):
     """Scraper for Cemaco.com (VTEX platform)."""
@@ -24,74 +46,179 @@ class CemacoScraper(BaseScraper):
         active=True
     )
     
+    # Static headers sent with every VTEX API request
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Referer": "https://www.cemaco.com/",
+        "Origin": "https://www.cemaco.com"
+    }
+    
+    # Maximum number of bytes of an error response body kept in error messages
+    ERROR_BODY_LIMIT = 2048
+    
+    # VTEX catalog search returns at most 50 products per request
+    MAX_PAGE_SIZE = 50
+    
+    # Successful results are reused for identical queries for this many seconds
+    CACHE_TTL = 300
+    CACHE_MAX_ENTRIES = 256
+    
+    # Read buffer large enough to take a full page of search results in one go
+    READ_BUFSIZE = 1 << 20
+    
     def __init__(self):
         super().__init__()  # Initializes self.vendor from VENDOR_INFO
         self.api_url = f"{self.vendor.base_url}/api/catalog_system/pub/products/search"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: Dict[Tuple[str, int], Tuple[float, ScrapingResult]] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
     
     async def search(self, query: str, max_results: int = 10) -> ScrapingResult:
         """Search for products on Cemaco."""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Keep the requested page within VTEX limits so the payload stays bounded
+        page_size = max(1, min(max_results, self.MAX_PAGE_SIZE))
+        cache_key = (query.strip().lower(), page_size)
+        
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={"duration": time.perf_counter() - start_time})
+        
+        # Share one upstream request between concurrent identical queries
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(cache_key, query, page_size, start_time))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
         
+        # Joined requests report their own wait, not the first caller's
+        result = await asyncio.shield(task)
+        return result.model_copy(update={"duration": time.perf_counter() - start_time})
+    
+    async def _fetch_and_cache(
+        self, cache_key: Tuple[str, int], query: str, page_size: int, start_time: float
+    ) -> ScrapingResult:
+        """Fetch results and cache them on success."""
+        result = await self._fetch(query, page_size, start_time)
+        if result.success:
+            self._set_cached(cache_key, result)
+        return result
+    
+    async def _fetch(self, query: str, page_size: int, start_time: float) -> ScrapingResult:
+        """Fetch one page of search results from the VTEX API."""
         try:
-            # Create session with proper headers
-            connector = aiohttp.TCPConnector(ssl=False)
-            timeout = aiohttp.ClientTimeout(total=30)
+            session = self._get_session()
             
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            ) as session:
-                
-                # Search via VTEX API
-                params = {
-                    "ft": query,
-                    "_from": "0",
-                    "_to": str(max_results - 1)
-                }
-                
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json, text/plain, */*",
-                    "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-                    "Referer": f"{self.vendor.base_url}/",
-                    "Origin": self.vendor.base_url
-                }
+            # Search via VTEX API
+            params = {
+                "ft": query,
+                "_from": "0",
+                "_to": str(page_size - 1)
+            }
+            
+            async with session.get(
+                self.api_url,
+                params=params
+            ) as response:
                 
-                async with session.get(
-                    self.api_url,
-                    params=params,
-                    headers=headers
-                ) as response:
+                # Accept both 200 and 206 (partial content)
+                if response.status in [200, 206]:
+                    data = json_loads(await response.read())
+                    products = self._parse_products(data)
+                    
+                    duration = time.perf_counter() - start_time
                     
-                    # Accept both 200 and 206 (partial content)
-                    if response.status in [200, 206]:
-                        data = await response.json()
-                        products = self._parse_products(data)
-                        
-                        duration = time.time() - start_time
-                        
-                        return ScrapingResult(
-                            vendor_id=self.vendor.id,
-                            vendor_name=self.vendor.name,
-                            success=True,
-                            products=products,
-                            duration=duration
-                        )
-                    else:
-                        error_msg = f"HTTP {response.status}: {await response.text()}"
-                        return self._error_result(error_msg, start_time)
+                    return ScrapingResult(
+                        vendor_id=self.vendor.id,
+                        vendor_name=self.vendor.name,
+                        success=True,
+                        products=products,
+                        duration=duration
+                    )
+                else:
+                    # Cap the error body so large HTML error pages stay cheap
+                    body = (await response.content.read(self.ERROR_BODY_LIMIT)).decode("utf-8", "replace")
+                    error_msg = f"HTTP {response.status}: {body}"
+                    return self._error_result(error_msg, start_time)
         
         except Exception as e:
             return self._error_result(str(e), start_time)
     
+    def _get_cached(self, key: Tuple[str, int]) -> Optional[ScrapingResult]:
+        """Get a cached result if it has not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        return result
+    
+    def _set_cached(self, key: Tuple[str, int], result: ScrapingResult):
+        """Cache a result, evicting the oldest entry when full."""
+        if key not in self._cache and len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.CACHE_TTL, result)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        # A single pooled session keeps connections to Cemaco alive between searches
+        if self._session is None or self._session.closed:
+            # Bounded per host so concurrent searches don't stampede Cemaco's frontend
+            connector = aiohttp.TCPConnector(
+                ssl=False,
+                limit=20,
+                limit_per_host=4,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(total=30, sock_read=15)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=self.HEADERS,
+                read_bufsize=self.READ_BUFSIZE
+            )
+        return self._session
+    
+    async def warm_up(self):
+        """Open the shared session and prime a connection to Cemaco."""
+        session = self._get_session()
+        try:
+            async with session.head(
+                self.vendor.base_url,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ):
+                pass
+        except Exception:
+            # Warm-up is best effort; the first search will connect instead
+            pass
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     def _parse_products(self, data: List[dict]) -> List[Product]:
         """Parse products from VTEX API response."""
         products = []
+        base_url = self.vendor.base_url
+        currency = self.vendor.currency
+        vendor_id = self.vendor.id
+        vendor_name = self.vendor.name
         
         for item in data:
+            # A malformed record is skipped rather than failing the whole search
             try:
                 # Extract basic product info
-                product_name = item.get("productName", "").strip()
+                product_name = (item.get("productName") or "").strip()
                 if not product_name:
                     continue
                 
@@ -99,38 +226,29 @@ class CemacoScraper(BaseScraper):
                 price = 0.0
                 availability = "unknown"
                 
-                items = item.get("items", [])
-                if items:
-                    first_item = items[0]
-                    sellers = first_item.get("sellers", [])
-                    if sellers:
-                        first_seller = sellers[0]
-                        commercial_offer = first_seller.get("commertialOffer", {})
-                        price = float(commercial_offer.get("Price", 0))
-                        available_quantity = commercial_offer.get("AvailableQuantity", 0)
-                        availability = "in_stock" if available_quantity > 0 else "out_of_stock"
+                commercial_offer = _follow(item, _OFFER_PATH)
+                if commercial_offer:
+                    price = float(commercial_offer.get("Price") or 0)
+                    available_quantity = commercial_offer.get("AvailableQuantity") or 0
+                    availability = "in_stock" if available_quantity > 0 else "out_of_stock"
                 
                 # Get product URL
                 link_text = item.get("linkText", "")
-                product_url = f"{self.vendor.base_url}/{link_text}/p" if link_text else ""
+                product_url = f"{base_url}/{link_text}/p" if link_text else ""
                 
                 # Get image URL
-                image_url = None
-                if items:
-                    images = items[0].get("images", [])
-                    if images:
-                        image_url = images[0].get("imageUrl", "")
+                image_url = _follow(item, _IMAGE_URL_PATH)
                 
                 # Extract brand
                 brand = item.get("brand", "")
                 
-                # Create product
-                product = Product(
+                # Fields are already typed above, so skip Pydantic validation
+                product = Product.model_construct(
                     name=product_name,
                     price=price,
-                    currency=self.vendor.currency,
-                    vendor_id=self.vendor.id,
-                    vendor_name=self.vendor.name,
+                    currency=currency,
+                    vendor_id=vendor_id,
+                    vendor_name=vendor_name,
                     url=product_url,
                     image_url=image_url,
                     availability=availability,
@@ -138,16 +256,15 @@ class CemacoScraper(BaseScraper):
                 )
                 
                 products.append(product)
-                
-            except Exception as e:
-                # Skip invalid products
-                continue
+            
+            except (KeyError, TypeError, ValueError, AttributeError):
+                logger.debug("Skipping malformed Cemaco product record", exc_info=True)
         
         return products
     
     def _error_result(self, error_message: str, start_time: float) -> ScrapingResult:
         """Create error result."""
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         return ScrapingResult(
             vendor_id=self.vendor.id,
             vendor_name=self.vendor.name,
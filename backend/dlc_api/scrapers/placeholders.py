@@ -2,14 +2,27 @@
 Placeholder scrapers for future implementation
 """
 
-import asyncio
 import time
 from typing import List
 from ..models import Vendor, Product, ScrapingResult
 from .base import BaseScraper
 
 
-class MaxScraper(BaseScraper):
+class PlaceholderScraper(BaseScraper):
+    """Base class for vendors without a real scraper yet."""
+    
+    async def search(self, query: str, max_results: int = 10) -> ScrapingResult:
+        """Placeholder search - returns empty results."""
+        return ScrapingResult(
+            vendor_id=self.vendor.id,
+            vendor_name=self.vendor.name,
+            success=True,
+            products=[],  # Empty for now
+            duration=0.0
+        )
+
+
+class MaxScraper(PlaceholderScraper):
     """Placeholder scraper for Max."""
     
     # Vendor information defined at class level
@@ -21,21 +34,9 @@ class MaxScraper(BaseScraper):
         currency="GTQ",
         active=True
     )
-    
-    async def search(self, query: str, max_results: int = 10) -> ScrapingResult:
-        """Placeholder search - returns empty results."""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        
-        return ScrapingResult(
-            vendor_id=self.vendor.id,
-            vendor_name=self.vendor.name,
-            success=True,
-            products=[],  # Empty for now
-            duration=0.1
-        )
 
 
-class ElektraScraper(BaseScraper):
+class ElektraScraper(PlaceholderScraper):
     """Placeholder scraper for Elektra."""
     
     # Vendor information defined at class level
@@ -47,21 +48,9 @@ class ElektraScraper(BaseScraper):
         currency="GTQ", 
         active=True
     )
-    
-    async def search(self, query: str, max_results: int = 10) -> ScrapingResult:
-        """Placeholder search - returns empty results."""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        
-        return ScrapingResult(
-            vendor_id=self.vendor.id,
-            vendor_name=self.vendor.name,
-            success=True,
-            products=[],  # Empty for now
-            duration=0.1
-        )
 
 
-class WalmartScraper(BaseScraper):
+class WalmartScraper(PlaceholderScraper):
     """Placeholder scraper for Walmart."""
     
     # Vendor information defined at class level
@@ -73,16 +62,3 @@ class WalmartScraper(BaseScraper):
         currency="GTQ",
         active=True
     )
-    
-    async def search(self, query: str, max_results: int = 10) -> ScrapingResult:
-        """Placeholder search - returns empty results."""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        
-        return ScrapingResult(
-            vendor_id=self.vendor.id,
-            vendor_name=self.vendor.name,
-            success=True,
-            products=[],  # Empty for now
-            duration=0.1
-        )
-
@@ -2,9 +2,11 @@
 Scraper registry for managing vendor scrapers and their information
 """
 
+import asyncio
 import importlib
 import pkgutil
-from typing import Dict, Type, List
+from types import MappingProxyType
+from typing import Dict, Type, List, Mapping, Optional
 from .base import BaseScraper
 from ..models import Vendor
 
@@ -17,21 +19,40 @@ class ScraperRegistry:
         self._vendor_cache: Dict[str, Vendor] = {}
         self._scraper_cache: Dict[str, BaseScraper] = {}
         self._discover_scrapers()
+        
+        # Read-only views; vendors do not change after discovery
+        self._scraper_classes_view = MappingProxyType(self._scraper_classes)
+        self._vendors_view = MappingProxyType(self._vendor_cache)
+        self._active_vendors_view = MappingProxyType({
+            vendor_id: vendor
+            for vendor_id, vendor in self._vendor_cache.items()
+            if vendor.active
+        })
     
     def _discover_scrapers(self):
-        """Discover and register all available scrapers."""
-        # Import current scrapers manually for now (will be auto-discovery later)
-        from .cemaco import CemacoScraper
-        from .placeholders import MaxScraper, ElektraScraper, WalmartScraper
-        
-        scrapers = [CemacoScraper, MaxScraper, ElektraScraper, WalmartScraper]
+        """Discover and register all scrapers defined in this package."""
+        package = importlib.import_module(__package__)
         
-        for scraper_class in scrapers:
-            if hasattr(scraper_class, 'VENDOR_INFO') and scraper_class.VENDOR_INFO:
-                vendor_id = scraper_class.VENDOR_INFO.id
-                self._scraper_classes[vendor_id] = scraper_class
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f".{module_info.name}", __package__)
+            
+            # Only consider scraper classes defined in this module (not imported ones)
+            for scraper_class in vars(module).values():
+                if not (
+                    isinstance(scraper_class, type)
+                    and issubclass(scraper_class, BaseScraper)
+                    and scraper_class.__module__ == module.__name__
+                ):
+                    continue
+                
+                # BaseScraper defines VENDOR_INFO = None, so one lookup is enough
+                vendor_info = scraper_class.VENDOR_INFO
+                if vendor_info is None:
+                    continue
+                
+                self._scraper_classes[vendor_info.id] = scraper_class
                 # Pre-cache vendor info
-                self._vendor_cache[vendor_id] = scraper_class.VENDOR_INFO
+                self._vendor_cache[vendor_info.id] = vendor_info
     
     def get_vendor(self, vendor_id: str) -> Vendor:
         """Get vendor information by ID."""
@@ -55,17 +76,29 @@ class ScraperRegistry:
         
         return self._scraper_cache[vendor_id]
     
-    def get_all_vendors(self) -> Dict[str, Vendor]:
-        """Get all available vendors."""
-        return self._vendor_cache.copy()
+    async def warm_up(self, vendor_ids: Optional[List[str]] = None):
+        """Instantiate and warm up scrapers concurrently (defaults to active vendors)."""
+        if vendor_ids is None:
+            vendor_ids = self.get_active_vendor_ids()
+        
+        scrapers = [self.get_scraper(vendor_id) for vendor_id in vendor_ids]
+        await asyncio.gather(
+            *(scraper.warm_up() for scraper in scrapers),
+            return_exceptions=True
+        )
     
-    def get_active_vendors(self) -> Dict[str, Vendor]:
-        """Get only active vendors."""
-        return {
-            vendor_id: vendor 
-            for vendor_id, vendor in self._vendor_cache.items() 
-            if vendor.active
-        }
+    async def aclose(self):
+        """Close all cached scraper instances."""
+        for scraper in self._scraper_cache.values():
+            await scraper.aclose()
+    
+    def get_all_vendors(self) -> Mapping[str, Vendor]:
+        """Get all available vendors (read-only view)."""
+        return self._vendors_view
+    
+    def get_active_vendors(self) -> Mapping[str, Vendor]:
+        """Get only active vendors (read-only view)."""
+        return self._active_vendors_view
     
     def get_vendor_ids(self) -> List[str]:
         """Get list of all vendor IDs."""
@@ -73,14 +106,11 @@ class ScraperRegistry:
     
     def get_active_vendor_ids(self) -> List[str]:
         """Get list of active vendor IDs."""
-        return [
-            vendor_id for vendor_id, vendor in self._vendor_cache.items()
-            if vendor.active
-        ]
+        return list(self._active_vendors_view.keys())
     
-    def get_scraper_classes(self) -> Dict[str, Type[BaseScraper]]:
-        """Get all scraper classes (for compatibility)."""
-        return self._scraper_classes.copy()
+    def get_scraper_classes(self) -> Mapping[str, Type[BaseScraper]]:
+        """Get all scraper classes (read-only view, for compatibility)."""
+        return self._scraper_classes_view
 
 
 # Global registry instance
@@ -91,11 +121,11 @@ def get_vendor(vendor_id: str) -> Vendor:
     """Get vendor by ID (compatibility function)."""
     return _registry.get_vendor(vendor_id)
 
-def get_all_vendors() -> Dict[str, Vendor]:
+def get_all_vendors() -> Mapping[str, Vendor]:
     """Get all vendors (compatibility function)."""
     return _registry.get_all_vendors()
 
-def get_active_vendors() -> Dict[str, Vendor]:
+def get_active_vendors() -> Mapping[str, Vendor]:
     """Get only active vendors (compatibility function)."""
     return _registry.get_active_vendors()
 
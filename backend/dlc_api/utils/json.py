@@ -0,0 +1,20 @@
+"""
+JSON encoding and decoding, backed by orjson with a standard library fallback
+"""
+
+import json
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+    
+    loads = orjson.loads
+    
+    def dumps(data) -> str:
+        """Serialize data to a compact JSON string."""
+        return orjson.dumps(data).decode("utf-8")
+except ImportError:
+    # Fall back to the standard library codec
+    loads = json.loads
+    dumps = json.dumps
@@ -12,6 +12,7 @@ setup(
         "fastapi>=0.104.0",
         "uvicorn[standard]>=0.24.0",
         "aiohttp>=3.9.0",
+        "orjson>=3.9.0",
         "beautifulsoup4>=4.12.0",
         "pydantic>=2.5.0",
         "python-dotenv>=1.0.0",
@@ -0,0 +1,195 @@
+"""
+Shared HTTP/Server-Sent Events client and runner for the API test scripts
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+import aiohttp
+
+from dlc_api.utils.json import JSONDecodeError, dumps as json_dumps, loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# API under test, and the search request body and headers the scripts send,
+# serialized once at import
+BASE_URL = "http://localhost:8000"
+SEARCH_BODY = json_dumps({"query": "iPhone", "max_results": 10}).encode("utf-8")
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# A whole SSE stream must finish within SSE_DEADLINE seconds, and a read fails
+# early if the server goes silent for 30 (it sends heartbeats every 15 seconds)
+SSE_DEADLINE = 60
+SSE_TIMEOUT = aiohttp.ClientTimeout(total=SSE_DEADLINE, sock_read=30)
+
+# Ask for an event stream and allow it to be compressed (aiohttp inflates
+# compressed bodies by default)
+SSE_HEADERS = {"Accept": "text/event-stream", "Accept-Encoding": "gzip"}
+
+# Field prefixes, matched on raw bytes so only values are ever decoded
+_EVENT = b'event:'
+_DATA = b'data:'
+_JSON_STARTS = (b'{', b'[')
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the pooled HTTP session shared by a whole test run."""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        keepalive_timeout=30,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30, connect=10)
+    )
+
+
+async def wait_until_ready(session: aiohttp.ClientSession, base_url: str, deadline: float = 5.0) -> bool:
+    """Poll the health endpoint with backoff until the API answers or the deadline passes."""
+    timeout = aiohttp.ClientTimeout(total=1)
+    start = time.monotonic()
+    delay = 0.05
+    while time.monotonic() - start < deadline:
+        try:
+            async with session.get(f"{base_url}/health", timeout=timeout) as response:
+                if response.status == 200:
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+
+def run(test: Callable[[aiohttp.ClientSession], Awaitable[None]]):
+    """Run a test coroutine against the API once it is ready, on uvloop when available."""
+    async def main():
+        # One session for the whole run, shared by every request
+        async with create_session() as session:
+            print("⏳ Waiting for the API to become ready...")
+            if not await wait_until_ready(session, BASE_URL):
+                print(f"❌ API not reachable at {BASE_URL}")
+                return
+            await test(session)
+    
+    try:
+        # uvloop ships with uvicorn[standard] on non-Windows platforms
+        from uvloop import run as run_loop
+    except ImportError:
+        run_loop = asyncio.run
+    
+    try:
+        run_loop(main())
+    except KeyboardInterrupt:
+        print("\n🛑 Test interrupted by user")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+
+
+# Product block templates, compiled once; the URL line is optional
+_format_product_head = (
+    "      📦 {name} - Q{price:.2f}\n"
+    "          🏪 {vendor_name}"
+).format_map
+_format_product_url = "\n          🔗 {}".format
+_PRODUCT_DEFAULTS = {"name": "Unknown", "price": 0, "vendor_name": None}
+
+
+def _shorten(text: str, limit: int = 60) -> str:
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def format_product(product: dict) -> str:
+    """Format a product_found payload as one printable block."""
+    block = _format_product_head({**_PRODUCT_DEFAULTS, **product})
+    if product.get('url'):
+        block += _format_product_url(_shorten(product['url']))
+    return block
+
+
+def _parse_event(block: bytes) -> Optional[Tuple[str, dict]]:
+    """Parse one SSE event block (without its blank-line terminator)."""
+    event_type = "message"
+    data_lines = []
+    
+    for line in block.split(b'\n'):
+        if not line:
+            continue
+        if line.startswith(_EVENT):
+            # Event names are always ASCII
+            event_type = line[6:].strip().decode('ascii')
+        elif line.startswith(_DATA):
+            data_lines.append(line[5:].strip())
+    
+    # Blocks without data (comments, stray separators) carry no event
+    if not data_lines:
+        return None
+    
+    payload = b'\n'.join(data_lines)
+    
+    # The API only sends JSON objects/arrays, so anything else is rejected
+    # without going through the decoder's exception path
+    if payload[:1] in _JSON_STARTS:
+        try:
+            return event_type, json_loads(payload)
+        except JSONDecodeError:
+            pass
+    
+    logger.warning("Skipping SSE event %r with malformed data: %.80r", event_type, payload)
+    return None
+
+
+def _parse_events(block: bytes) -> List[Tuple[str, dict]]:
+    """Parse every SSE event in a block of one or more events."""
+    events = []
+    for part in block.split(b'\n\n'):
+        event = _parse_event(part)
+        if event is not None:
+            events.append(event)
+    return events
+
+
+async def next_events(reader: aiohttp.StreamReader, pending: bytearray) -> List[Tuple[str, dict]]:
+    """Wait for the next SSE events; returns an empty list at end of stream.
+    
+    ``pending`` holds the bytes of any unfinished event between calls.
+    """
+    while True:
+        # Take every complete event buffered so far in one slice
+        end = pending.rfind(b'\n\n')
+        if end != -1:
+            block = bytes(pending[:end])
+            del pending[:end + 2]
+            events = _parse_events(block)
+            if events:
+                return events
+            continue
+        
+        chunk = await reader.readany()
+        if not chunk:
+            # End of stream: parse whatever is left unterminated
+            block = bytes(pending)
+            pending.clear()
+            return _parse_events(block)
+        
+        # Normalise CRLF framing to LF; a CR whose LF arrives in the next
+        # read stays in the buffer and is joined up on that pass
+        pending += chunk
+        if b'\r' in chunk:
+            pending[:] = pending.replace(b'\r\n', b'\n')
+
+
+async def iter_sse_events(response: aiohttp.ClientResponse) -> AsyncIterator[Tuple[str, dict]]:
+    """Yield (event_type, data) pairs from an SSE response."""
+    pending = bytearray()
+    while True:
+        events = await next_events(response.content, pending)
+        if not events:
+            break
+        for event in events:
+            yield event
@@ -4,164 +4,192 @@ Test script for the new OOP-based DondeLoCompro.gt API
 
 import asyncio
 import aiohttp
-import json
 import time
 
+from sse_client import (
+    BASE_URL,
+    JSON_HEADERS,
+    SEARCH_BODY,
+    SSE_DEADLINE,
+    SSE_HEADERS,
+    SSE_TIMEOUT,
+    format_product,
+    iter_sse_events,
+    json_loads,
+    run,
+)
 
-async def test_new_api():
+
+def _on_connected(data: dict, stats: dict) -> bool:
+    print(f"      🔗 {data.get('message', 'Connected')}")
+    return False
+
+
+def _on_started(data: dict, stats: dict) -> bool:
+    print(f"      🔍 Query: {data.get('query')}")
+    vendors = data.get('vendors', [])
+    if vendors:
+        print(f"      🏪 Vendors: {', '.join(vendors)}")
+    return False
+
+
+def _on_vendor_started(data: dict, stats: dict) -> bool:
+    print(f"      🏪 Started: {data.get('vendor_name')}")
+    return False
+
+
+def _on_product_found(data: dict, stats: dict) -> bool:
+    stats["products"] += 1
+    # One write per product instead of one per line
+    print(format_product(data.get('product', {})))
+    return False
+
+
+def _on_vendor_completed(data: dict, stats: dict) -> bool:
+    vendor_id = data.get('vendor_id')
+    products_found = data.get('products_found', 0)
+    duration = data.get('duration', 0)
+    print(f"      ✅ {vendor_id}: {products_found} products in {duration:.2f}s")
+    return False
+
+
+def _on_completed(data: dict, stats: dict) -> bool:
+    total_results = data.get('total_results', 0)
+    total_duration = data.get('duration', 0)
+    print(f"      🎉 Search completed!")
+    print(f"      📊 Total results: {total_results}")
+    print(f"      ⏱️  Total duration: {total_duration:.2f}s")
+    return True
+
+
+def _on_error(data: dict, stats: dict) -> bool:
+    print(f"      ❌ Error: {data.get('error')}")
+    return True
+
+
+# SSE event type -> handler; a handler returns True when the stream is finished
+EVENT_HANDLERS = {
+    "connected": _on_connected,
+    "started": _on_started,
+    "vendor_started": _on_vendor_started,
+    "product_found": _on_product_found,
+    "vendor_completed": _on_vendor_completed,
+    "completed": _on_completed,
+    "error": _on_error,
+}
+
+
+async def test_new_api(session: aiohttp.ClientSession):
     """Test the new API architecture."""
     
     print("🧪 Testing DondeLoCompro.gt API v2.0.0 (OOP Architecture)")
     print("=" * 60)
     
-    base_url = "http://localhost:8000"
+    base_url = BASE_URL
     
-    async with aiohttp.ClientSession() as session:
-        
-        # Test 1: Health endpoint
-        print("1. Testing health endpoint...")
-        try:
-            async with session.get(f"{base_url}/health") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"   ✅ Health: {data['status']}")
-                    print(f"   📊 Scrapers: {', '.join(data['scrapers'])}")
-                    print(f"   🟢 Active: {', '.join(data.get('active_scrapers', []))}")
-                else:
-                    print(f"   ❌ Health check failed: {response.status}")
-                    return
-        except Exception as e:
-            print(f"   ❌ Health check error: {e}")
-            return
-        
-        # Test 2: Start search
-        print("2. Starting search...")
-        search_data = {
-            "query": "iPhone",
-            "max_results": 10
-        }
-        
-        try:
-            async with session.post(f"{base_url}/search", json=search_data) as response:
-                if response.status == 200:
-                    search_response = await response.json()
-                    search_id = search_response["search_id"]
-                    sse_url = search_response["sse_url"]
-                    print(f"   ✅ Search started: {search_id}")
-                    print(f"   📡 SSE URL: {sse_url}")
-                else:
-                    print(f"   ❌ Search failed: {response.status}")
-                    return
-        except Exception as e:
-            print(f"   ❌ Search error: {e}")
-            return
+    # Test 1: Health endpoint
+    print("1. Testing health endpoint...")
+    try:
+        async with session.get(f"{base_url}/health") as response:
+            if response.status == 200:
+                data = json_loads(await response.read())
+                print(f"   ✅ Health: {data['status']}")
+                print(f"   📊 Scrapers: {', '.join(data['scrapers'])}")
+                print(f"   🟢 Active: {', '.join(data.get('active_scrapers', []))}")
+            else:
+                print(f"   ❌ Health check failed: {response.status}")
+                return
+    except Exception as e:
+        print(f"   ❌ Health check error: {e}")
+        return
+    
+    # Test 2: Start search
+    print("2. Starting search...")
+    try:
+        async with session.post(f"{base_url}/search", data=SEARCH_BODY, headers=JSON_HEADERS) as response:
+            if response.status == 200:
+                search_response = json_loads(await response.read())
+                search_id = search_response["search_id"]
+                sse_url = search_response["sse_url"]
+                print(f"   ✅ Search started: {search_id}")
+                print(f"   📡 SSE URL: {sse_url}")
+            else:
+                print(f"   ❌ Search failed: {response.status}")
+                return
+    except Exception as e:
+        print(f"   ❌ Search error: {e}")
+        return
+    
+    # Test 3: SSE Events
+    print("3. Connecting to Server-Sent Events...")
+    try:
+        start_time = time.perf_counter()
+        event_count = 0
+        stats = {"products": 0}
         
-        # Test 3: SSE Events
-        print("3. Connecting to Server-Sent Events...")
-        try:
-            start_time = time.time()
-            event_count = 0
-            product_count = 0
+        async with session.get(sse_url, headers=SSE_HEADERS, timeout=SSE_TIMEOUT) as response:
+            print("   ✅ SSE connected, listening for events...")
             
-            async with session.get(sse_url) as response:
-                print("   ✅ SSE connected, listening for events...")
+            async for event_type, data in iter_sse_events(response):
+                event_count += 1
+                elapsed = time.perf_counter() - start_time
                 
-                async for line in response.content:
-                    line = line.decode('utf-8').strip()
-                    
-                    if line.startswith('event:'):
-                        event_type = line.split(':', 1)[1].strip()
-                    elif line.startswith('data:'):
-                        try:
-                            data = json.loads(line.split(':', 1)[1].strip())
-                            event_count += 1
-                            elapsed = time.time() - start_time
-                            
-                            print(f"   📨 [{elapsed:.2f}s] {event_type}")
-                            
-                            if event_type == "connected":
-                                print(f"      🔗 {data.get('message', 'Connected')}")
-                            elif event_type == "started":
-                                print(f"      🔍 Query: {data.get('query')}")
-                                vendors = data.get('vendors', [])
-                                if vendors:
-                                    print(f"      🏪 Vendors: {', '.join(vendors)}")
-                            elif event_type == "vendor_started":
-                                print(f"      🏪 Started: {data.get('vendor_name')}")
-                            elif event_type == "product_found":
-                                product = data.get('product', {})
-                                product_count += 1
-                                print(f"      📦 {product.get('name', 'Unknown')} - Q{product.get('price', 0):.2f}")
-                                print(f"          🏪 {product.get('vendor_name')}")
-                                if product.get('url'):
-                                    url = product['url']
-                                    if len(url) > 60:
-                                        url = url[:57] + "..."
-                                    print(f"          🔗 {url}")
-                            elif event_type == "vendor_completed":
-                                vendor_id = data.get('vendor_id')
-                                products_found = data.get('products_found', 0)
-                                duration = data.get('duration', 0)
-                                print(f"      ✅ {vendor_id}: {products_found} products in {duration:.2f}s")
-                            elif event_type == "completed":
-                                total_results = data.get('total_results', 0)
-                                total_duration = data.get('duration', 0)
-                                print(f"      🎉 Search completed!")
-                                print(f"      📊 Total results: {total_results}")
-                                print(f"      ⏱️  Total duration: {total_duration:.2f}s")
-                                break
-                            elif event_type == "error":
-                                print(f"      ❌ Error: {data.get('error')}")
-                                break
-                                
-                        except json.JSONDecodeError:
-                            pass
-                        except Exception as e:
-                            print(f"      ⚠️  Event processing error: {e}")
-                            
-        except Exception as e:
-            print(f"   ❌ SSE error: {e}")
-            return
-        
-        # Test 4: Get final results
-        print("4. Getting final results...")
-        try:
-            async with session.get(f"{base_url}/search/{search_id}/results") as response:
-                if response.status == 200:
-                    results = await response.json()
-                    print(f"   ✅ Results retrieved")
-                    print(f"   📊 Status: {results.get('status')}")
-                    print(f"   📦 Products: {len(results.get('products', []))}")
-                    print(f"   📨 Events: {len(results.get('events', []))}")
-                else:
-                    print(f"   ❌ Results retrieval failed: {response.status}")
-        except Exception as e:
-            print(f"   ❌ Results error: {e}")
+                print(f"   📨 [{elapsed:.2f}s] {event_type}")
+                
+                try:
+                    handler = EVENT_HANDLERS.get(event_type)
+                    if handler and handler(data, stats):
+                        break
+                except Exception as e:
+                    print(f"      ⚠️  Event processing error: {e}")
+                        
+    except aiohttp.ServerTimeoutError:
+        # Idle-read limit hit (a subclass of asyncio.TimeoutError, so caught first)
+        print(f"   ⏰ SSE stream went silent for over {SSE_TIMEOUT.sock_read}s")
+    except asyncio.TimeoutError:
+        # Deadline hit; still fetch whatever results the search has so far
+        print(f"   ⏰ SSE stream did not finish within {SSE_DEADLINE}s")
+    except Exception as e:
+        print(f"   ❌ SSE error: {e}")
+        return
     
+    # Test 4: Get final results
+    print("4. Getting final results...")
+    try:
+        async with session.get(f"{base_url}/search/{search_id}/results") as response:
+            if response.status == 200:
+                results = json_loads(await response.read())
+                print("\n".join([
+                    f"   ✅ Results retrieved",
+                    f"   📊 Status: {results.get('status')}",
+                    f"   📦 Products: {len(results.get('products', []))}",
+                    f"   📨 Events: {len(results.get('events', []))}",
+                ]))
+            else:
+                print(f"   ❌ Results retrieval failed: {response.status}")
+    except Exception as e:
+        print(f"   ❌ Results error: {e}")
+
     # Summary
-    total_time = time.time() - start_time
-    print(f"\n📊 Test Summary:")
-    print(f"   ⏱️  Total time: {total_time:.2f}s")
-    print(f"   📨 Events received: {event_count}")
-    print(f"   📦 Products found: {product_count}")
+    product_count = stats["products"]
+    total_time = time.perf_counter() - start_time
     
     if total_time < 3.0 and product_count > 0:
-        print(f"   ⚡ Performance: Excellent")
+        performance = "   ⚡ Performance: Excellent"
     elif total_time < 5.0 and product_count > 0:
-        print(f"   ✅ Performance: Good")
+        performance = "   ✅ Performance: Good"
     else:
-        print(f"   ⚠️  Performance: Needs improvement")
+        performance = "   ⚠️  Performance: Needs improvement"
+    
+    print("\n".join([
+        f"\n📊 Test Summary:",
+        f"   ⏱️  Total time: {total_time:.2f}s",
+        f"   📨 Events received: {event_count}",
+        f"   📦 Products found: {product_count}",
+        performance,
+    ]))
 
 
 if __name__ == "__main__":
     print("🚀 Make sure the API is running: python -m dlc_api.main_new")
-    print("⏳ Starting test in 3 seconds...")
-    time.sleep(3)
-    
-    try:
-        asyncio.run(test_new_api())
-    except KeyboardInterrupt:
-        print("\n🛑 Test interrupted by user")
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-
+    run(test_new_api)
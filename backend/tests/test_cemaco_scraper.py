@@ -0,0 +1,85 @@
+"""
+Tests for CemacoScraper's result cache and in-flight request sharing
+"""
+
+import asyncio
+
+import pytest
+
+from dlc_api.models import ScrapingResult
+from dlc_api.scrapers import CemacoScraper
+
+
+class FetchStub:
+    """Replacement for CemacoScraper._fetch that counts upstream requests."""
+    
+    def __init__(self, success=True):
+        self.calls = 0
+        self.success = success
+        self.release = asyncio.Event()
+        self.release.set()
+    
+    async def __call__(self, query, page_size, start_time):
+        self.calls += 1
+        await self.release.wait()
+        return ScrapingResult(
+            vendor_id="cemaco",
+            vendor_name="Cemaco",
+            success=self.success,
+            error_message=None if self.success else "boom",
+        )
+
+
+@pytest.fixture
+def scraper():
+    return CemacoScraper()
+
+
+@pytest.fixture
+def fetch(scraper, monkeypatch):
+    stub = FetchStub()
+    monkeypatch.setattr(scraper, "_fetch", stub)
+    return stub
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache(scraper, fetch):
+    await scraper.search("Taladro", 10)
+    result = await scraper.search("  taladro ", 10)
+    
+    assert fetch.calls == 1
+    assert result.success
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_fetched_again(scraper, fetch):
+    scraper.CACHE_TTL = -1
+    
+    await scraper.search("taladro", 10)
+    await scraper.search("taladro", 10)
+    
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_results_are_not_cached(scraper, fetch):
+    fetch.success = False
+    
+    await scraper.search("taladro", 10)
+    await scraper.search("taladro", 10)
+    
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_fetch(scraper, fetch):
+    fetch.release.clear()
+    searches = [asyncio.ensure_future(scraper.search("taladro", 10)) for _ in range(3)]
+    await asyncio.sleep(0)
+    fetch.release.set()
+    
+    results = await asyncio.gather(*searches)
+    
+    assert fetch.calls == 1
+    assert all(result.success for result in results)
+    assert scraper._inflight == {}
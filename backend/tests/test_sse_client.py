@@ -0,0 +1,70 @@
+"""
+Tests for the shared SSE client used by the API test scripts
+"""
+
+import logging
+
+import pytest
+
+from sse_client import _parse_events, iter_sse_events
+
+
+class FakeStream:
+    """Stand-in for aiohttp's StreamReader that returns preset network reads."""
+    
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+    
+    async def readany(self):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.content = FakeStream(chunks)
+
+
+STREAM = (
+    b'event: product_found\ndata: {"product": {"name": "A"}}\n\n'
+    b'event: completed\ndata: {"total_results": 1}\n\n'
+)
+EXPECTED = [
+    ("product_found", {"product": {"name": "A"}}),
+    ("completed", {"total_results": 1}),
+]
+
+
+async def collect(chunks):
+    return [event async for event in iter_sse_events(FakeResponse(chunks))]
+
+
+def test_parse_events_returns_every_event_in_a_block():
+    assert _parse_events(STREAM.rstrip(b"\n")) == EXPECTED
+
+
+def test_parse_events_skips_blocks_without_data():
+    assert _parse_events(b": comment\n\nevent: heartbeat") == []
+
+
+def test_parse_events_logs_malformed_data(caplog):
+    with caplog.at_level(logging.WARNING, logger="sse_client"):
+        assert _parse_events(b"event: product_found\ndata: {broken") == []
+    assert "product_found" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_events_single_read():
+    assert await collect([STREAM]) == EXPECTED
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framing", [b"\n", b"\r\n"], ids=["lf", "crlf"])
+async def test_iter_sse_events_separator_split_across_reads(framing):
+    stream = STREAM.replace(b"\n", framing)
+    for cut in range(1, len(stream)):
+        assert await collect([stream[:cut], stream[cut:]]) == EXPECTED, cut
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_events_parses_unterminated_tail():
+    assert await collect([STREAM[:-2]]) == EXPECTED